@@ -13,7 +13,8 @@ Options:
     --save-auth-only    Log in and save session without scraping
     --auth-file FILE    Session JSON path (default: twitter_auth.json)
     --max-scrolls N     Max scroll attempts (default: 100)
-    --scroll-delay S    Seconds between scrolls (default: 2.0)
+    --scroll-delay S    Max seconds to wait for new tweets per scroll (default: 2.0)
+    --min-scroll-delay S  Min seconds to wait after each scroll (default: 0.5)
     --output STEM       Output filename stem (default: bookmarks)
     --format FORMAT     csv | jsonl | both (default: csv)
     --headless          Run browser headlessly (requires saved session)
@@ -29,12 +30,17 @@ import re
 import signal
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from urllib.parse import urlparse
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import requests
+from requests.adapters import HTTPAdapter
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout, Page, BrowserContext
 
+try:
+    import orjson  # optional, faster JSONL encoding
+except ImportError:
+    orjson = None
+
 # ── Logging ──────────────────────────────────────────────────────────────────
 
 logging.basicConfig(
@@ -48,37 +54,146 @@ log = logging.getLogger(__name__)
 
 LOGIN_SLUGS = ("x.com/login", "x.com/i/flow", "x.com/account/")
 
+_URL_RE = re.compile(r"https?://[^\s\"'<>)]+")
+_IMG_NAME_RE = re.compile(r"[&?]name=\w+")
+_STATUS_RE = re.compile(r"/status/(\d+)")
+_NL_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+_ARTICLE_RE = re.compile(r"https?://(?:[^/?#]*\.)?(?:x|twitter)\.com(?::\d+)?/(?:[^?#]*/)?articles/", re.I)
+_EXTERNAL_RE = re.compile(r"https?://(?!(?:www\.)?(?:x|twitter)\.com(?:[/?#:]|$))", re.I)
+
 
 def _is_login_page(url: str) -> bool:
     return any(slug in url for slug in LOGIN_SLUGS)
 
 
+# In-page equivalent of `not _is_login_page(location.href)`; takes LOGIN_SLUGS
+LOGGED_IN_JS = "slugs => !slugs.some(s => location.href.includes(s))"
+
+
+# Concurrent t.co lookups; the connection pool is sized to match so no worker
+# ever waits on (or discards) a pooled connection.
+EXPAND_WORKERS = 32
+
+# Shared session so t.co lookups reuse keep-alive connections across workers
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = "Mozilla/5.0"
+_ADAPTER = HTTPAdapter(pool_connections=EXPAND_WORKERS, pool_maxsize=EXPAND_WORKERS, max_retries=0)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+
+# Some hosts behind t.co reject HEAD; retry those with a body-less GET
+HEAD_REJECTED = {403, 405}
+
+
 def expand_tco_url(short_url: str, timeout: float = 10) -> str:
     try:
-        resp = requests.head(
-            short_url, allow_redirects=True, timeout=timeout,
-            headers={"User-Agent": "Mozilla/5.0"},
-        )
-        return resp.url
+        with _SESSION.head(short_url, allow_redirects=True, timeout=timeout, stream=True) as resp:
+            if resp.status_code not in HEAD_REJECTED:
+                return resp.url
+        # stream=True + closing without touching .content reads headers only
+        with _SESSION.get(short_url, allow_redirects=True, timeout=timeout, stream=True) as resp:
+            return resp.url
     except Exception:
         return short_url
 
 
-def expand_urls_parallel(urls: list[str], workers: int = 10) -> dict[str, str]:
-    tco_urls = [u for u in urls if "t.co/" in u]
+# ── t.co cache ────────────────────────────────────────────────────────────────
+
+TCO_CACHE_FILE = os.path.expanduser("~/.cache/twitter_bookmark_scrapper/tco.json")
+TCO_CACHE_TTL = 30 * 24 * 3600  # seconds
+
+
+def _load_tco_cache() -> dict[str, list]:
+    """Return {short_url: [long_url, saved_at]} with expired entries dropped."""
+    if not os.path.exists(TCO_CACHE_FILE):
+        return {}
+    cutoff = time.time() - TCO_CACHE_TTL
+    try:
+        with open(TCO_CACHE_FILE, encoding="utf-8") as f:
+            cache = json.load(f)
+        if not isinstance(cache, dict):
+            raise ValueError("not a JSON object")
+        for k, v in cache.items():
+            if not (isinstance(v, list) and len(v) == 2
+                    and isinstance(v[0], str) and isinstance(v[1], (int, float))):
+                raise ValueError(f"malformed entry for {k!r}")
+        return {k: v for k, v in cache.items() if v[1] >= cutoff}
+    except Exception as exc:
+        log.warning("Ignoring unreadable t.co cache %s: %s", TCO_CACHE_FILE, exc)
+        return {}
+
+
+_TCO_CACHE: dict[str, list] | None = None
+
+
+def _tco_cache() -> dict[str, list]:
+    """Load the t.co cache on first use and keep it for the rest of the run."""
+    global _TCO_CACHE
+    if _TCO_CACHE is None:
+        _TCO_CACHE = _load_tco_cache()
+    return _TCO_CACHE
+
+
+def _save_tco_cache(cache: dict[str, list]) -> None:
+    try:
+        os.makedirs(os.path.dirname(TCO_CACHE_FILE), exist_ok=True)
+        tmp = TCO_CACHE_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp, TCO_CACHE_FILE)
+    except OSError as exc:
+        log.warning("Failed to save t.co cache: %s", exc)
+
+
+# Long-lived so t.co lookups can start while bookmarks are still being scrolled
+_EXPAND_POOL = ThreadPoolExecutor(max_workers=EXPAND_WORKERS, thread_name_prefix="tco")
+_PREFETCHED: dict[str, Future] = {}
+
+
+def prefetch_tco_urls(tco_urls: list[str]) -> None:
+    """Start expanding uncached t.co links in the background."""
+    cache = _tco_cache()
+    for u in tco_urls:
+        if u not in cache and u not in _PREFETCHED:
+            _PREFETCHED[u] = _EXPAND_POOL.submit(expand_tco_url, u)
+
+
+def cancel_tco_prefetch() -> None:
+    """Drop queued background lookups so an aborted run can exit promptly."""
+    for fut in _PREFETCHED.values():
+        fut.cancel()
+    _PREFETCHED.clear()
+
+
+def expand_urls_parallel(tco_urls: list[str]) -> dict[str, str]:
+    """Resolve t.co links, reusing cached and already-prefetched results."""
     if not tco_urls:
         return {}
-    mapping: dict[str, str] = {}
-    with ThreadPoolExecutor(max_workers=workers) as pool:
-        futures = {pool.submit(expand_tco_url, u): u for u in tco_urls}
-        for fut in as_completed(futures):
-            mapping[futures[fut]] = fut.result()
+    cache = _tco_cache()
+    mapping: dict[str, str] = {u: cache[u][0] for u in tco_urls if u in cache}
+    pending = [u for u in tco_urls if u not in mapping]
+    if mapping:
+        log.info("Resolved %d t.co link(s) from cache.", len(mapping))
+    if not pending:
+        return mapping
+
+    done_early = sum(1 for u in pending if u in _PREFETCHED and _PREFETCHED[u].done())
+    if done_early:
+        log.info("%d t.co link(s) were already expanded during scrolling.", done_early)
+    prefetch_tco_urls(pending)
+    now = time.time()
+    for short in pending:
+        long_url = _PREFETCHED.pop(short).result()
+        mapping[short] = long_url
+        if long_url != short:  # don't cache failed lookups
+            cache[short] = [long_url, now]
+    _save_tco_cache(cache)
     return mapping
 
 
 def is_article_url(url: str) -> bool:
-    parsed = urlparse(url)
-    return "/articles/" in parsed.path and parsed.netloc.lower().endswith(("x.com", "twitter.com"))
+    return _ARTICLE_RE.match(url) is not None
 
 
 # ── Interactive Login ─────────────────────────────────────────────────────────
@@ -87,7 +202,7 @@ def is_article_url(url: str) -> bool:
 def interactive_login(context: BrowserContext, auth_file: str) -> bool:
     """
     Navigate to X login, wait for the user to log in, detect success
-    via JavaScript URL polling, save session, and return True on success.
+    via an in-page URL wait, save session, and return True on success.
     Uses signal-based SIGINT so Ctrl+C saves before Chrome dies.
     """
     page = context.pages[0] if context.pages else context.new_page()
@@ -109,28 +224,34 @@ def interactive_login(context: BrowserContext, auth_file: str) -> bool:
     signal.signal(signal.SIGINT, _sigint_handler)
 
     logged_in = False
-    last_log_t = 0.0
     try:
         while not stop_flag:
             all_pages = context.pages
             if not all_pages:
                 break
-
-            now = time.monotonic()
-
-            # Get real URLs via JS (page.url doesn't reflect SPA navigation)
-            urls = []
-            for p in all_pages:
-                try:
-                    urls.append(p.evaluate("location.href"))
-                except Exception:
-                    pass
-
-            if now - last_log_t >= 5:
+            if page.is_closed():
+                page = all_pages[0]
+
+            # The URL check runs inside the page (page.url doesn't reflect SPA
+            # navigation), so waiting costs no round-trips. Short waits keep
+            # Ctrl+C responsive.
+            try:
+                page.wait_for_function(LOGGED_IN_JS, arg=list(LOGIN_SLUGS), timeout=5_000)
+                detected = True
+            except Exception as exc:
+                if not isinstance(exc, PlaywrightTimeout):
+                    time.sleep(0.5)
+                # Login may have finished in another tab (e.g. an OAuth popup)
+                urls = []
+                for p in all_pages:
+                    try:
+                        urls.append(p.evaluate("location.href"))
+                    except Exception:
+                        pass
                 log.info("Waiting for login … (current: %s)", urls[-1] if urls else "?")
-                last_log_t = now
+                detected = any(not _is_login_page(u) for u in urls)
 
-            if any(not _is_login_page(u) for u in urls):
+            if detected:
                 logged_in = True
                 log.info("Login detected ✓")
                 try:
@@ -141,8 +262,6 @@ def interactive_login(context: BrowserContext, auth_file: str) -> bool:
                     logged_in = False
                 break
 
-            time.sleep(0.5)
-
     except Exception as exc:
         log.debug("Login loop error: %s", exc)
     finally:
@@ -162,33 +281,75 @@ def interactive_login(context: BrowserContext, auth_file: str) -> bool:
 # ── Article fetcher ───────────────────────────────────────────────────────────
 
 
-def fetch_article_content(page: Page, article_url: str) -> str:
-    """Open an X Article in a new tab and return its full body text."""
+ARTICLE_TABS = 6  # articles loaded concurrently
+
+
+def _close_quietly(ap: Page) -> None:
+    try:
+        ap.close()
+    except Exception as exc:
+        log.debug("Failed to close article tab: %s", exc)
+
+
+def _read_article_body(ap: Page, article_url: str) -> str:
+    """Wait for an already-navigating tab to load, return its body text and close it."""
     try:
-        log.info("Fetching article: %s", article_url)
-        ap = page.context.new_page()
-        ap.goto(article_url, wait_until="domcontentloaded", timeout=30_000)
+        ap.wait_for_load_state("domcontentloaded", timeout=30_000)
         body = ap.query_selector('[data-testid="articleBody"]') or ap.query_selector("article")
         text = body.inner_text() if body else ""
-        ap.close()
         return text.strip()
     except Exception as exc:
         log.warning("Failed to fetch article %s: %s", article_url, exc)
         return ""
+    finally:
+        _close_quietly(ap)
+
+
+def fetch_article_content(context: BrowserContext, article_urls: list[str],
+                          tabs: int = ARTICLE_TABS) -> dict[str, str]:
+    """
+    Open X Articles in batches of concurrent tabs and return {url: body text}.
+    Each tab only waits for navigation to commit before the next one starts,
+    so the browser loads the whole batch in parallel.
+    """
+    texts: dict[str, str] = {}
+    for i in range(0, len(article_urls), tabs):
+        if i:
+            time.sleep(1)
+        opened: list[tuple[str, Page]] = []
+        for url in article_urls[i:i + tabs]:
+            log.info("Fetching article: %s", url)
+            ap = None
+            try:
+                ap = context.new_page()
+                ap.goto(url, wait_until="commit", timeout=30_000)
+            except Exception as exc:
+                log.warning("Failed to fetch article %s: %s", url, exc)
+                if ap is not None:
+                    _close_quietly(ap)
+                texts[url] = ""
+                continue
+            opened.append((url, ap))
+        for url, ap in opened:
+            texts[url] = _read_article_body(ap, url)
+    return texts
 
 
 # ── Bookmark Collection ──────────────────────────────────────────────────────
 
 
+SCROLL_SETTLE_MS = 500  # no further tweets for this long = batch has loaded
+
+
 def collect_bookmarks(page: Page, max_scrolls: int, scroll_delay: float,
-                      no_articles: bool) -> list[dict]:
+                      no_articles: bool, min_scroll_delay: float = 0.5) -> list[dict]:
     """
     Navigate to the bookmarks page and scroll-collect all tweets.
     Expects a page within an authenticated browser context.
     Handles Ctrl+C gracefully — returns whatever was collected so far.
     """
     bookmarks: list[dict] = []
-    seen_ids: set[str] = set()
+    seen_ids: set[int] = set()  # status IDs (text-prefix hash when there's no permalink)
 
     log.info("Navigating to bookmarks …")
     page.goto("https://x.com/i/bookmarks", wait_until="domcontentloaded")
@@ -242,19 +403,21 @@ def collect_bookmarks(page: Page, max_scrolls: int, scroll_delay: float,
             if stop_scrolling:
                 break
 
-            articles = page.query_selector_all('article[data-testid="tweet"]')
+            raw_tweets = page.eval_on_selector_all('article[data-testid="tweet"]', EXTRACT_TWEETS_JS)
             new_this_round = 0
-            for art in articles:
+            for raw in raw_tweets:
                 try:
-                    tweet = _parse_tweet(art)
+                    tweet = _parse_tweet(raw)
                 except Exception as exc:
                     log.debug("Skipping unparseable tweet: %s", exc)
                     continue
-                tid = tweet["tweet_url"] or tweet["text"][:80]
+                m = _STATUS_RE.search(tweet["tweet_url"])
+                tid = int(m.group(1)) if m else hash(tweet["text"][:80])
                 if tid in seen_ids:
                     continue
                 seen_ids.add(tid)
                 bookmarks.append(tweet)
+                prefetch_tco_urls(tweet["tco_urls"])
                 new_this_round += 1
 
             if new_this_round:
@@ -270,16 +433,30 @@ def collect_bookmarks(page: Page, max_scrolls: int, scroll_delay: float,
                     break
 
             page.evaluate("window.scrollBy(0, window.innerHeight * 2)")
-            time.sleep(scroll_delay)
+            # Continue once the newly loaded batch has settled, but never
+            # sooner than min_scroll_delay; scroll_delay is the cap
+            max_wait = max(scroll_delay, min_scroll_delay)
+            if max_wait > 0:
+                try:
+                    page.wait_for_function(
+                        NEW_TWEETS_JS,
+                        arg={"key": scroll_idx, "settleMs": SCROLL_SETTLE_MS,
+                             "minMs": min_scroll_delay * 1000},
+                        polling=100, timeout=max_wait * 1000,
+                    )
+                except PlaywrightTimeout:
+                    pass
 
         # ── Fetch X Articles ──────────────────────────────────────────────
         if not no_articles and not stop_scrolling:
             article_bookmarks = [b for b in bookmarks if b["article_url"]]
             if article_bookmarks:
                 log.info("Fetching %d X Article(s) …", len(article_bookmarks))
+                texts = fetch_article_content(
+                    page.context, list(dict.fromkeys(b["article_url"] for b in article_bookmarks)),
+                )
                 for b in article_bookmarks:
-                    b["article_text"] = fetch_article_content(page, b["article_url"])
-                    time.sleep(1)
+                    b["article_text"] = texts[b["article_url"]]
 
     finally:
         signal.signal(signal.SIGINT, original_handler)
@@ -288,48 +465,113 @@ def collect_bookmarks(page: Page, max_scrolls: int, scroll_delay: float,
     return bookmarks
 
 
-def _parse_tweet(art) -> dict:
-    """Extract structured data from a single tweet article element."""
-    handle_el = art.query_selector('a[role="link"][href*="/"]')
-    handle = (handle_el.get_attribute("href") or "").strip("/") if handle_el else ""
-    name_el = art.query_selector('div[data-testid="User-Name"] a span')
-    name = name_el.inner_text() if name_el else ""
-    text_el = art.query_selector('div[data-testid="tweetText"]')
-    text = text_el.inner_text() if text_el else ""
-    time_el = art.query_selector("time")
-    ts = time_el.get_attribute("datetime") if time_el else ""
-    tweet_url = time_el.evaluate("el => el.closest('a') ? el.closest('a').href : ''") if time_el else ""
+# Serializes tweets not yet returned on this page in one round-trip; Python
+# post-processes. Status IDs already sent are remembered in window.__seen so
+# each scroll only ships the newly loaded tweets.
+EXTRACT_TWEETS_JS = r"""
+articles => {
+    const P = {
+        handle: 'a[role="link"][href*="/"]',
+        name: 'div[data-testid="User-Name"] a span',
+        text: 'div[data-testid="tweetText"]',
+        time: 'time',
+        img: 'div[data-testid="tweetPhoto"] img',
+        link: 'a[href^="http"]',
+    };
+    const ALL = Object.values(P).join(', ');
+    const seen = window.__seen || (window.__seen = new Set());
+    return articles.filter(a => {
+        const link = a.querySelector('time')?.closest('a');
+        const m = link && link.href.match(/\/status\/(\d+)/);
+        if (!m) return true;
+        if (seen.has(m[1])) return false;
+        seen.add(m[1]);
+        return true;
+    }).map(a => {
+        // One subtree walk per tweet; each element is dispatched to the
+        // fields whose selector it matches (document order, first wins).
+        const t = {handle: null, name: null, text: null, ts: null, tweet_url: null, links: [], imgs: []};
+        for (const el of a.querySelectorAll(ALL)) {
+            if (t.handle === null && el.matches(P.handle)) t.handle = el.getAttribute('href');
+            if (t.name === null && el.matches(P.name)) t.name = el.innerText;
+            if (t.text === null && el.matches(P.text)) t.text = el.innerText;
+            if (t.ts === null && el.tagName === 'TIME') {
+                t.ts = el.getAttribute('datetime');
+                const link = el.closest('a');
+                t.tweet_url = link ? link.href : null;
+            }
+            if (el.matches(P.link)) t.links.push(el.getAttribute('href'));
+            if (el.matches(P.img)) t.imgs.push(el.getAttribute('src'));
+        }
+        return t;
+    });
+}
+"""
+
+# Resolves once the page holds tweets EXTRACT_TWEETS_JS hasn't returned yet,
+# their count has stopped growing for settleMs, and minMs has passed since the
+# scroll. State is kept per `key` (the scroll index) between polls.
+NEW_TWEETS_JS = r"""
+({key, settleMs, minMs}) => {
+    const seen = window.__seen;
+    const n = [...document.querySelectorAll('article[data-testid="tweet"]')].filter(a => {
+        const link = a.querySelector('time')?.closest('a');
+        const m = link && link.href.match(/\/status\/(\d+)/);
+        return m && !(seen && seen.has(m[1]));
+    }).length;
+    const now = performance.now();
+    let s = window.__settle;
+    if (!s || s.key !== key) s = window.__settle = {key, start: now, n, changed: now};
+    if (n !== s.n) {
+        s.n = n;
+        s.changed = now;
+    }
+    return n > 0 && now - s.changed >= settleMs && now - s.start >= minMs;
+}
+"""
+
 
-    raw_urls: set[str] = set(re.findall(r"https?://[^\s\"'<>\)]+", text))
+def _parse_tweet(raw: dict) -> dict:
+    """Build a bookmark record from one tweet serialized by EXTRACT_TWEETS_JS."""
+    handle = (raw["handle"] or "").strip("/")
+    name = raw["name"] or ""
+    text = raw["text"] or ""
+    ts = raw["ts"] or ""
+    tweet_url = raw["tweet_url"] or ""
+
+    raw_urls: set[str] = set(_URL_RE.findall(text))
     article_url = ""
 
-    for el in art.query_selector_all('a[href^="http"]'):
-        href = el.get_attribute("href") or ""
+    for href in raw["links"]:
+        href = href or ""
         if is_article_url(href):
             if not article_url:
                 article_url = href
-        elif "t.co" in href or urlparse(href).netloc.lower() not in {"x.com", "twitter.com"}:
+        elif "t.co" in href or _EXTERNAL_RE.match(href):
             raw_urls.add(href)
 
     # ── Image URLs ────────────────────────────────────────────────────────
     image_urls: list[str] = []
-    for img_el in art.query_selector_all('div[data-testid="tweetPhoto"] img'):
-        src = img_el.get_attribute("src") or ""
+    for src in raw["imgs"]:
+        src = src or ""
         if src and "pbs.twimg.com/media" in src:
             # Get the highest quality version
-            clean = re.sub(r'[&?]name=\w+', '', src)
+            clean = _IMG_NAME_RE.sub("", src)
             image_urls.append(clean + "?name=orig")
 
+    # Classified once here so the output stage needs no second pass
+    urls_raw = sorted(raw_urls)
     return {
         "timestamp":    ts,
         "author_name":  name,
         "author_handle": f"@{handle}" if handle else "",
-        "text":         text.replace("\n", " ").strip(),
+        "text":         text.translate(_NL_TABLE).strip(),
         "tweet_url":    tweet_url,
         "article_url":  article_url,
         "article_text": "",
         "image_urls":   image_urls,
-        "urls_raw":     sorted(raw_urls),
+        "urls_raw":     urls_raw,
+        "tco_urls":     [u for u in urls_raw if "t.co/" in u],
     }
 
 
@@ -342,50 +584,111 @@ CSV_FIELDS = [
 ]
 
 
-def _build_rows(bookmarks: list[dict]) -> tuple[list[dict], list[dict]]:
-    """Expand t.co links and return (csv_rows, jsonl_rows)."""
-    all_tco = list({u for b in bookmarks for u in b["urls_raw"] if "t.co/" in u})
+def _jsonl_line(row: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(row) + b"\n"
+    # Compact separators so the bytes match orjson's output
+    return (json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _iter_rows(bookmarks: list[dict]):
+    """Expand t.co links, then yield (csv_row, jsonl_row) one bookmark at a time."""
+    all_tco = list(set().union(*(b["tco_urls"] for b in bookmarks)))
     log.info("Expanding %d unique t.co links …", len(all_tco))
     url_map = expand_urls_parallel(all_tco)
     log.info("Expanded %d / %d links.", len(url_map), len(all_tco))
 
-    csv_rows, jsonl_rows = [], []
+    gm = url_map.get
+    base_keys = ("timestamp", "author_name", "author_handle",
+                 "text", "tweet_url", "article_url", "article_text")
     for b in bookmarks:
-        expanded = [url_map.get(u, u) for u in b["urls_raw"]]
+        expanded = [gm(u, u) for u in b["urls_raw"]] if url_map else b["urls_raw"]
         images = b.get("image_urls", [])
-        base = {k: b[k] for k in ("timestamp", "author_name", "author_handle",
-                                   "text", "tweet_url", "article_url", "article_text")}
-        csv_rows.append({**base,
-                         "image_urls": " | ".join(images),
-                         "urls_expanded": " | ".join(expanded)})
-        jsonl_rows.append({**base,
-                           "image_urls": images,
-                           "urls_expanded": expanded})
-    return csv_rows, jsonl_rows
+        base = {k: b[k] for k in base_keys}
+        yield ({**base,
+                "image_urls": " | ".join(images),
+                "urls_expanded": " | ".join(expanded)},
+               {**base,
+                "image_urls": images,
+                "urls_expanded": expanded})
 
 
 def save_output(bookmarks: list[dict], stem: str, fmt: str) -> None:
-    """Expand URLs and write output files."""
-    csv_rows, jsonl_rows = _build_rows(bookmarks)
+    """
+    Expand URLs and stream rows into the output files. Each file is written
+    under a .tmp name and moved into place only once complete.
+    """
+    want_csv = fmt in ("csv", "both")
+    want_jsonl = fmt in ("jsonl", "both")
+    csv_path, jsonl_path = f"{stem}.csv", f"{stem}.jsonl"
 
-    if fmt in ("csv", "both"):
-        path = f"{stem}.csv"
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            w = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+    csv_f = jsonl_f = None
+    try:
+        if want_csv:
+            csv_f = open(csv_path + ".tmp", "w", newline="", encoding="utf-8")
+        if want_jsonl:
+            jsonl_f = open(jsonl_path + ".tmp", "wb")
+        if csv_f:
+            w = csv.DictWriter(csv_f, fieldnames=CSV_FIELDS)
             w.writeheader()
-            w.writerows(csv_rows)
-        log.info("Saved → %s", path)
+        for csv_row, jsonl_row in _iter_rows(bookmarks):
+            if csv_f:
+                w.writerow(csv_row)
+            if jsonl_f:
+                jsonl_f.write(_jsonl_line(jsonl_row))
+    except BaseException:
+        for f in (csv_f, jsonl_f):
+            if f:
+                f.close()
+                try:
+                    os.remove(f.name)
+                except OSError:
+                    pass
+        raise
+    finally:
+        for f in (csv_f, jsonl_f):
+            if f:
+                f.close()
 
-    if fmt in ("jsonl", "both"):
-        path = f"{stem}.jsonl"
-        with open(path, "w", encoding="utf-8") as f:
-            for row in jsonl_rows:
-                f.write(json.dumps(row, ensure_ascii=False) + "\n")
-        log.info("Saved → %s", path)
+    for path, f in ((csv_path, csv_f), (jsonl_path, jsonl_f)):
+        if f:
+            os.replace(path + ".tmp", path)
+            log.info("Saved → %s", path)
 
 
 # ── CLI ───────────────────────────────────────────────────────────────────────
 
+# Only URLs are scraped, never the bytes, so these are skipped while scrolling
+BLOCKED_URL_PATTERNS = [
+    "*://pbs.twimg.com/*", "*://video.twimg.com/*",
+    "*.woff*", "*.ttf*", "*.otf*",
+]
+
+
+def _block_media(page: Page):
+    """
+    Block image/video/font downloads for one page at the Chromium network
+    layer. Unlike context.route this keeps the HTTP cache and involves no
+    Python callback per request. Returns the CDP session; detach it to
+    unblock.
+    """
+    try:
+        cdp = page.context.new_cdp_session(page)
+        cdp.send("Network.enable")
+        cdp.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        return cdp
+    except Exception as exc:
+        log.debug("Media blocking unavailable: %s", exc)
+        return None
+
+
+def _unblock_media(cdp) -> None:
+    if cdp is not None:
+        try:
+            cdp.detach()
+        except Exception as exc:
+            log.debug("Failed to detach CDP session: %s", exc)
+
 
 def main() -> None:
     p = argparse.ArgumentParser(
@@ -399,7 +702,9 @@ def main() -> None:
     p.add_argument("--max-scrolls", type=int, default=100,
                    help="Max scroll attempts (default: 100)")
     p.add_argument("--scroll-delay", type=float, default=2.0,
-                   help="Seconds between scrolls (default: 2.0)")
+                   help="Max seconds to wait for new tweets per scroll (default: 2.0)")
+    p.add_argument("--min-scroll-delay", type=float, default=0.5,
+                   help="Min seconds to wait after each scroll (default: 0.5)")
     p.add_argument("--output", default="bookmarks",
                    help="Output filename stem without extension (default: bookmarks)")
     p.add_argument("--format", dest="fmt", choices=["csv", "jsonl", "both"], default="csv",
@@ -413,69 +718,80 @@ def main() -> None:
     has_session = os.path.exists(args.auth_file)
     need_login = not has_session and not args.headless
 
-    with sync_playwright() as pw:
-        browser = pw.chromium.launch(
-            channel="chrome",
-            headless=args.headless,
-            args=["--disable-blink-features=AutomationControlled"],
-        )
-        context = browser.new_context(
-            storage_state=args.auth_file if has_session else None,
-            viewport={"width": 1280, "height": 900},
-        )
-
-        # ── Step 1: Login if needed ───────────────────────────────────────
-        if need_login or args.save_auth_only:
-            ok = interactive_login(context, args.auth_file)
-            if not ok:
-                log.error("Login failed or was cancelled.")
+    try:
+        with sync_playwright() as pw:
+            browser = pw.chromium.launch(
+                channel="chrome",
+                headless=args.headless,
+                args=["--disable-blink-features=AutomationControlled"],
+            )
+            context = browser.new_context(
+                storage_state=args.auth_file if has_session else None,
+                viewport={"width": 1280, "height": 900},
+            )
+
+            # ── Step 1: Login if needed ───────────────────────────────────
+            if need_login or args.save_auth_only:
+                ok = interactive_login(context, args.auth_file)
+                if not ok:
+                    log.error("Login failed or was cancelled.")
+                    context.close()
+                    browser.close()
+                    sys.exit(1)
+                if args.save_auth_only:
+                    log.info("Session saved. Exiting (--save-auth-only).")
+                    context.close()
+                    browser.close()
+                    sys.exit(0)
+
+            elif args.headless and not has_session:
+                log.error("No session file found at '%s'.", args.auth_file)
+                log.error("Run without --headless first to log in.")
                 context.close()
                 browser.close()
                 sys.exit(1)
-            if args.save_auth_only:
-                log.info("Session saved. Exiting (--save-auth-only).")
-                context.close()
-                browser.close()
-                sys.exit(0)
 
-        elif args.headless and not has_session:
-            log.error("No session file found at '%s'.", args.auth_file)
-            log.error("Run without --headless first to log in.")
+            # ── Step 2: Scrape bookmarks ──────────────────────────────────
+            page = context.pages[0] if context.pages else context.new_page()
+            media_block = _block_media(page)
+            bookmarks = collect_bookmarks(
+                page,
+                max_scrolls=args.max_scrolls,
+                scroll_delay=args.scroll_delay,
+                min_scroll_delay=args.min_scroll_delay,
+                no_articles=args.no_articles,
+            )
+
+            # ── Step 3: If scrape failed and we're not headless, try login
+            if not bookmarks and not args.headless:
+                log.info("Scrape failed — attempting interactive login …")
+                _unblock_media(media_block)  # login may need captcha images
+                ok = interactive_login(context, args.auth_file)
+                if ok:
+                    page = context.pages[0] if context.pages else context.new_page()
+                    media_block = _block_media(page)
+                    bookmarks = collect_bookmarks(
+                        page,
+                        max_scrolls=args.max_scrolls,
+                        scroll_delay=args.scroll_delay,
+                        min_scroll_delay=args.min_scroll_delay,
+                        no_articles=args.no_articles,
+                    )
+
             context.close()
             browser.close()
-            sys.exit(1)
-
-        # ── Step 2: Scrape bookmarks ──────────────────────────────────────
-        page = context.pages[0] if context.pages else context.new_page()
-        bookmarks = collect_bookmarks(
-            page,
-            max_scrolls=args.max_scrolls,
-            scroll_delay=args.scroll_delay,
-            no_articles=args.no_articles,
-        )
-
-        # ── Step 3: If scrape failed and we're not headless, try login ────
-        if not bookmarks and not args.headless:
-            log.info("Scrape failed — attempting interactive login …")
-            ok = interactive_login(context, args.auth_file)
-            if ok:
-                page = context.pages[0] if context.pages else context.new_page()
-                bookmarks = collect_bookmarks(
-                    page,
-                    max_scrolls=args.max_scrolls,
-                    scroll_delay=args.scroll_delay,
-                    no_articles=args.no_articles,
-                )
 
-        context.close()
-        browser.close()
+        if not bookmarks:
+            log.warning("No bookmarks collected.")
+            return
 
-    if not bookmarks:
-        log.warning("No bookmarks collected.")
-        return
+        stem = args.output.removesuffix(".csv").removesuffix(".jsonl")
+        save_output(bookmarks, stem, args.fmt)
 
-    stem = args.output.removesuffix(".csv").removesuffix(".jsonl")
-    save_output(bookmarks, stem, args.fmt)
+    finally:
+        # Queued background t.co lookups would otherwise hold up interpreter exit
+        cancel_tco_prefetch()
+        _EXPAND_POOL.shutdown(wait=False, cancel_futures=True)
 
 
 if __name__ == "__main__":